@@ -15,6 +15,30 @@ try:
 except ImportError:
     pass
 
+try:
+    # Optional fast path for CPython hosts (desktop testing, Blinka on a
+    # Raspberry Pi).
+    import numpy as _np
+except ImportError:
+    try:
+        # ulab offers a numpy subset on CircuitPython builds that include it.
+        from ulab import numpy as _np
+    except ImportError:
+        _np = None
+if _np is not None and not hasattr(_np, "packbits"):
+    # The vectorized helper needs packbits (and the boolean indexing that
+    # comes with it); ulab builds without it use the scalar path instead.
+    _np = None  # pylint: disable=invalid-name
+
+try:
+    from micropython import const
+except ImportError:
+
+    def const(value):
+        "Fallback for hosts without micropython's compile-time const folding."
+        return value
+
+
 """
 `adafruit_irremote`
 ====================================================
@@ -67,6 +91,25 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_IRRemote.git"
 
+# NEC protocol timings in microseconds. const() lets MicroPython fold these
+# into the bytecode instead of doing a global lookup per comparison.
+_NEC_HEADER_MARK_LO = const(6750)  # 9000 us header mark +-25%
+_NEC_HEADER_MARK_HI = const(11250)
+_NEC_HEADER_SPACE_LO = const(3375)  # 4500 us header space +-25%
+_NEC_HEADER_SPACE_HI = const(5625)
+_NEC_MARK_LO = const(420)  # 560 us mark +-25%
+_NEC_MARK_HI = const(700)
+_NEC_SPACE_LO = const(420)  # 560 us zero-space -25%
+_NEC_SPACE_HI = const(2113)  # 1690 us one-space +25%
+_NEC_BIT_THRESHOLD = const(1125)  # midpoint of 560/1690 us spaces
+# NEC repeat frames: header mark, half-length header space, single mark.
+_NEC_REPEAT_MARK_LO = const(8000)
+_NEC_REPEAT_MARK_HI = const(10000)
+_NEC_REPEAT_SPACE_LO = const(2000)
+_NEC_REPEAT_SPACE_HI = const(3000)
+_NEC_REPEAT_TRAIL_LO = const(450)
+_NEC_REPEAT_TRAIL_HI = const(700)
+
 
 class IRDecodeException(Exception):
     """Generic decode exception"""
@@ -76,115 +119,282 @@ class IRNECRepeatException(Exception):
     """Exception when a NEC repeat is decoded"""
 
 
-def bin_data(pulses: List) -> List[List]:
-    """Compute bins of pulse lengths where pulses are +-25% of the average.
+def bin_data(
+    pulses: List, start: int = 0, stop: Optional[int] = None, step: int = 1
+) -> List[List]:
+    """Compute bins of pulse lengths where pulses are +-25% of the average,
+    returned as [average, count] pairs.
+
+    The selected pulses are sorted and swept once: a new bin opens whenever a
+    width exceeds +25% of the running average of the open bin. One compare
+    per pulse, integer math only, and the same +-25% grouping the original
+    per-bin scan produced.
 
     :param list pulses: Input pulse lengths
+    :param int start: Index of the first pulse to consider
+    :param int stop: Index to stop before, or None for the end
+    :param int step: Stride between considered pulses
+
+    The start/stop/step indices let callers bin a strided subset (e.g. only
+    the even or odd pulses) without slicing out a copy themselves.
+    """
+    if stop is None:
+        stop = len(pulses)
+    return _bin_sorted([pulses[i] for i in range(start, stop, step)])
+
+
+def _bin_sorted(values: List) -> List[List]:
+    """Sweep pulse widths (sorted in place) into [average, count] bins.
+
+    The single home of the binning semantics: a value belongs to the open bin
+    while it is within +25% of the bin's running average, otherwise it opens
+    a new bin. Callers own ``values``; it is scratch space.
     """
-    bins = [[pulses[0], 0]]
-
-    for _, pulse in enumerate(pulses):
-        matchedbin = False
-        # print(pulse, end=": ")
-        for b, pulse_bin in enumerate(bins):
-            if pulse_bin[0] * 0.75 <= pulse <= pulse_bin[0] * 1.25:
-                # print("matches bin")
-                bins[b][0] = (pulse_bin[0] + pulse) // 2  # avg em
-                bins[b][1] += 1  # track it
-                matchedbin = True
-                break
-        if not matchedbin:
-            bins.append([pulse, 1])
-        # print(bins)
+    if not values:
+        return []
+    values.sort()
+    bins = []
+    total = 0
+    count = 0
+    for value in values:
+        if count and value * 4 > (total // count) * 5:
+            bins.append([total // count, count])
+            total = 0
+            count = 0
+        total += value
+        count += 1
+    bins.append([total // count, count])
     return bins
 
 
+def _bin_interleaved(pulses, stop: int) -> Tuple[List[List], List[List]]:
+    """Bin the even and odd pulse sequences in a single pass over the buffer.
+
+    Splits the pulses by parity (one list append each) and hands both lists
+    to the shared _bin_sorted() core, so the binning semantics live in one
+    place. Returns (even_bins, odd_bins); "evens" historically start at
+    index 1, so they carry odd parity.
+    """
+    evens = []
+    odds = []
+    for i in range(1, stop):
+        if i & 1:
+            evens.append(pulses[i])
+        else:
+            odds.append(pulses[i])
+    return _bin_sorted(evens), _bin_sorted(odds)
+
+
+def _decode_nec_fast(input_pulses: Tuple, pulses) -> Optional[NamedTuple]:
+    """Decode a frame already recognized as NEC-shaped.
+
+    NEC timings are fixed (560 us mark, 560 or 1690 us space), so binning and
+    outlier filtering can be skipped entirely: each bit is its space width
+    tested against the 1125 us midpoint. Returns None if any pulse width
+    doesn't hold up, so the caller can fall back to the generic pipeline.
+    """
+    output = bytearray(4)
+    acc = 0
+    nbits = 0
+    for i in range(2, 66, 2):
+        if not _NEC_MARK_LO <= pulses[i] <= _NEC_MARK_HI:
+            return None
+        space = pulses[i + 1]
+        if not _NEC_SPACE_LO <= space <= _NEC_SPACE_HI:
+            return None
+        acc = (acc << 1) | (space > _NEC_BIT_THRESHOLD)
+        nbits += 1
+        if nbits & 7 == 0:
+            output[(nbits >> 3) - 1] = acc
+            acc = 0
+    return IRMessage(input_pulses, code=bytes(output))
+
+
+def _classify_and_pack_numpy(  # pylint: disable=too-many-arguments
+    pulses, start, stop, mark_lo, space_hi, threshold, out_lo, out_hi
+):
+    """Vectorized mark/space classification and bit packing.
+
+    Returns the packed code as bytes, or None when this path does not apply
+    (bit count not byte-aligned, or pulses outside mark/space; the scalar
+    loop then reproduces the exact behavior including error reporting).
+    """
+    arr = _np.frombuffer(pulses, dtype=_np.uint16)[start:stop:2]
+    arr = arr[(arr < out_lo) | (arr > out_hi)]  # skip outliers
+    if len(arr) & 7:
+        return None  # scalar path handles the right-aligned tail byte
+    if len(arr) and (arr.min() < mark_lo or arr.max() > space_hi):
+        return None
+    return _np.packbits(arr > threshold).tobytes()
+
+
 def decode_bits(pulses: List) -> NamedTuple:
-    """Decode the pulses into bits."""
+    """Decode the pulses into bits.
+
+    The code in the returned message is ``bytes`` -- one object instead of a
+    boxed int per byte. Index or iterate it for the individual byte values
+    (or call ``tuple()`` on it if a tuple is needed).
+
+    Raises FailedToDecode (carrying the UnparseableIRMessage) when the pulses
+    can't be parsed.
+    """
+    result = _decode_bits_nothrow(pulses)
+    if isinstance(result, UnparseableIRMessage):
+        raise FailedToDecode(result)
+    return result
+
+
+def _decode_bits_nothrow(pulses: List) -> NamedTuple:
+    """Decode pulses, returning an UnparseableIRMessage instead of raising.
+
+    Steady-state callers like NonblockingGenericDecode see corrupted bursts
+    routinely (dim emitters, sunlight), so reporting failure by return value
+    keeps exception construction and stack unwinding out of that loop.
+    """
     # pylint: disable=too-many-branches,too-many-statements
+    # pylint: disable=too-many-locals,too-many-return-statements
 
     # TODO The name pulses is redefined several times below, so we'll stash the
     # original in a separate variable for now. It might be worth refactoring to
     # avoid redefining pulses, for the sake of readability.
     input_pulses = tuple(pulses)
-    pulses = list(pulses)  # Copy to avoid mutating input.
+    # Unsigned shorts keep the pulse widths unboxed, which matters on
+    # memory-constrained boards. Buffers that already hold raw uint16s (like
+    # the memoryview NonblockingGenericDecode hands us) are used as-is; the
+    # decode below only ever reads them.
+    if not isinstance(pulses, memoryview) and not (
+        isinstance(pulses, array.array) and pulses.typecode == "H"
+    ):
+        try:
+            pulses = array.array("H", pulses)
+        except TypeError:
+            # Float pulse widths (simulated or host-captured timings) decode
+            # the same as they always have; truncate them to microseconds.
+            try:
+                pulses = array.array("H", (int(p) for p in input_pulses))
+            except (OverflowError, ValueError):
+                return UnparseableIRMessage(input_pulses, reason="Pulse out of range")
+        except (OverflowError, ValueError):
+            # A pulse outside 0..65535 can't be real IR timing.
+            return UnparseableIRMessage(input_pulses, reason="Pulse out of range")
+
+    num_pulses = len(pulses)
 
     # special exception for NEC repeat code!
     if (
-        (len(pulses) == 3)
-        and (8000 <= pulses[0] <= 10000)
-        and (2000 <= pulses[1] <= 3000)
-        and (450 <= pulses[2] <= 700)
+        (num_pulses == 3)
+        and (_NEC_REPEAT_MARK_LO <= pulses[0] <= _NEC_REPEAT_MARK_HI)
+        and (_NEC_REPEAT_SPACE_LO <= pulses[1] <= _NEC_REPEAT_SPACE_HI)
+        and (_NEC_REPEAT_TRAIL_LO <= pulses[2] <= _NEC_REPEAT_TRAIL_HI)
     ):
         return NECRepeatIRMessage(input_pulses)
 
-    if len(pulses) < 10:
-        msg = UnparseableIRMessage(input_pulses, reason="Too short")
-        raise FailedToDecode(msg)
+    if num_pulses < 10:
+        return UnparseableIRMessage(input_pulses, reason="Too short")
+
+    # Fast path for the overwhelmingly common NEC frame shape: 9 ms header
+    # mark, 4.5 ms header space, 32 data bits. Falls through to the generic
+    # binning pipeline on any mismatch.
+    if (
+        66 <= num_pulses <= 68
+        and _NEC_HEADER_MARK_LO <= pulses[0] <= _NEC_HEADER_MARK_HI
+        and _NEC_HEADER_SPACE_LO <= pulses[1] <= _NEC_HEADER_SPACE_HI
+    ):
+        message = _decode_nec_fast(input_pulses, pulses)
+        if message is not None:
+            return message
 
     # Ignore any header (evens start at 1), and any trailer.
-    if len(pulses) % 2 == 0:
-        pulses_end = -1
+    if num_pulses % 2 == 0:
+        pulses_end = num_pulses - 1
     else:
-        pulses_end = None
+        pulses_end = num_pulses
 
-    evens = pulses[1:pulses_end:2]
-    odds = pulses[2:pulses_end:2]
-
-    # bin both halves
-    even_bins = bin_data(evens)
-    odd_bins = bin_data(odds)
+    # Bin both halves in one pass over the buffer, no strided re-reads.
+    even_bins, odd_bins = _bin_interleaved(pulses, pulses_end)
 
     outliers = [b[0] for b in (even_bins + odd_bins) if b[1] == 1]
     even_bins = [b for b in even_bins if b[1] > 1]
     odd_bins = [b for b in odd_bins if b[1] > 1]
 
     if not even_bins or not odd_bins:
-        msg = UnparseableIRMessage(input_pulses, reason="Not enough data")
-        raise FailedToDecode(msg)
+        return UnparseableIRMessage(input_pulses, reason="Not enough data")
 
     if len(even_bins) == 1:
-        pulses = odds
+        pulses_start = 2
         pulse_bins = odd_bins
     elif len(odd_bins) == 1:
-        pulses = evens
+        pulses_start = 1
         pulse_bins = even_bins
     else:
-        msg = UnparseableIRMessage(input_pulses, reason="Both even/odd pulses differ")
-        raise FailedToDecode(msg)
+        return UnparseableIRMessage(input_pulses, reason="Both even/odd pulses differ")
 
     if len(pulse_bins) == 1:
-        msg = UnparseableIRMessage(input_pulses, reason="Pulses do not differ")
-        raise FailedToDecode(msg)
+        return UnparseableIRMessage(input_pulses, reason="Pulses do not differ")
     if len(pulse_bins) > 2:
-        msg = UnparseableIRMessage(input_pulses, reason="Only mark & space handled")
-        raise FailedToDecode(msg)
-
-    mark = min(pulse_bins[0][0], pulse_bins[1][0])
-    space = max(pulse_bins[0][0], pulse_bins[1][0])
-
+        return UnparseableIRMessage(input_pulses, reason="Only mark & space handled")
+
+    # Exactly two bins remain here; one compare orders them.
+    mark = pulse_bins[0][0]
+    space = pulse_bins[1][0]
+    if mark > space:
+        mark, space = space, mark
+
+    # Marks and spaces are well separated (bin_data would have merged them
+    # otherwise), so one midpoint compare classifies each pulse; the +-25%
+    # sanity bounds are only checked against the overall min/max afterward.
+    # All integer math -- floats are emulated in software on many M0 boards.
+    threshold = (mark + space) // 2
+    mark_lo = (mark * 3) // 4
+    space_hi = (space * 5) // 4
     if outliers:
-        # skip outliers
-        pulses = [
-            p for p in pulses if not (outliers[0] * 0.75) <= p <= (outliers[0] * 1.25)
-        ]
-    # convert marks/spaces to 0 and 1
-    for i, pulse_length in enumerate(pulses):
-        if (space * 0.75) <= pulse_length <= (space * 1.25):
-            pulses[i] = True
-        elif (mark * 0.75) <= pulse_length <= (mark * 1.25):
-            pulses[i] = False
-        else:
-            msg = UnparseableIRMessage(input_pulses, reason="Pulses outside mark/space")
-            raise FailedToDecode(msg)
-
-    # convert bits to bytes!
-    output = [0] * ((len(pulses) + 7) // 8)
-    for i, pulse_length in enumerate(pulses):
-        output[i // 8] = output[i // 8] << 1
-        if pulse_length:
-            output[i // 8] |= 1
-    return IRMessage(tuple(input_pulses), code=tuple(output))
+        out_lo = (outliers[0] * 3) // 4
+        out_hi = (outliers[0] * 5) // 4
+    else:
+        out_lo, out_hi = 1, 0  # empty range, matches nothing
+
+    if _np is not None and num_pulses > 32:
+        code = _classify_and_pack_numpy(
+            pulses,
+            pulses_start,
+            pulses_end,
+            mark_lo,
+            space_hi,
+            threshold,
+            out_lo,
+            out_hi,
+        )
+        if code is not None:
+            return IRMessage(tuple(input_pulses), code=code)
+
+    # Classify marks/spaces and pack the bits in one fused, branchless pass:
+    # outliers are skipped inline and each bit is a single midpoint compare
+    # fed straight into the rolling accumulator. Min/max are tracked so range
+    # validation happens once, after the loop.
+    output = bytearray()
+    acc = 0
+    nbits = 0
+    shortest = 0xFFFF
+    longest = 0
+    for i in range(pulses_start, pulses_end, 2):
+        pulse_length = pulses[i]
+        if out_lo <= pulse_length <= out_hi:
+            continue
+        if pulse_length < shortest:
+            shortest = pulse_length
+        if pulse_length > longest:
+            longest = pulse_length
+        acc = (acc << 1) | (pulse_length > threshold)
+        nbits += 1
+        if nbits & 7 == 0:
+            output.append(acc)
+            acc = 0
+    if shortest < mark_lo or longest > space_hi:
+        return UnparseableIRMessage(input_pulses, reason="Pulses outside mark/space")
+    if nbits & 7:
+        # Trailing partial byte stays right-aligned, as before.
+        output.append(acc)
+    return IRMessage(tuple(input_pulses), code=bytes(output))
 
 
 IRMessage = namedtuple("IRMessage", ("pulses", "code"))
@@ -207,6 +417,10 @@ class NonblockingGenericDecode:
 
     :param ~pulseio.PulseIn input_pulses: Object to read pulses from
     :param int max_pulse: Pulse duration to end a burst.  Units are microseconds.
+    :param int max_len: Maximum number of pulses buffered per message. Pulses
+        beyond this are silently dropped, truncating the message, so raise it
+        for protocols with long frames (some A/C remotes send hundreds of
+        pulses).
 
     >>> pulses = PulseIn(...)
     >>> decoder = NonblockingGenericDecoder(pulses)
@@ -221,10 +435,15 @@ class NonblockingGenericDecode:
     ...         ...
     """
 
-    def __init__(self, pulses: List, max_pulse: int = 10_000) -> None:
+    def __init__(
+        self, pulses: List, max_pulse: int = 10_000, max_len: int = 256
+    ) -> None:
         self.pulses = pulses  # PulseIn
         self.max_pulse = max_pulse
-        self._unparsed_pulses = []  # internal buffer of partial messages
+        # Fixed buffer of partial messages plus a write cursor: storing raw
+        # uint16s avoids a per-pulse int allocation and list resizing.
+        self._buf = array.array("H", [0] * max_len)
+        self._num_pulses = 0
 
     def read(self) -> None:
         """
@@ -238,21 +457,97 @@ class NonblockingGenericDecode:
         while self.pulses:
             pulse = self.pulses.popleft()
             if pulse <= self.max_pulse:
-                self._unparsed_pulses.append(pulse)
+                if self._num_pulses < len(self._buf):
+                    self._buf[self._num_pulses] = pulse
+                    self._num_pulses += 1
+                # else: buffer full; the rest of this message is dropped and
+                # it will likely decode as unparseable. Raise max_len if your
+                # protocol sends frames this long.
             else:
                 # End of message! Decode it and yield a BaseIRMessage.
-                result = None
-                try:
-                    result = decode_bits(self._unparsed_pulses)
-                except FailedToDecode as err:
-                    # If you want to debug failed decodes, this would be a good
-                    # place to print/log or (re-)raise.
-                    result = err.args[0]
-
-                self._unparsed_pulses.clear()
+                # The nothrow variant hands back an UnparseableIRMessage
+                # directly, keeping exception overhead out of this loop.
+                result = _decode_bits_nothrow(memoryview(self._buf)[: self._num_pulses])
+                self._num_pulses = 0
                 yield result
 
 
+class StreamingNECDecoder:
+    """Decode NEC frames one pulse at a time, in constant memory.
+
+    Unlike the buffering decoders, no pulse history is kept: ``feed()``
+    consumes each pulse as it is read from PulseIn and the decode completes
+    the instant the last bit arrives. Only the fixed NEC frame shape is
+    recognized; pulses that don't fit it simply reset the decoder, so use the
+    generic decoders for other protocols (or mixed traffic).
+
+    >>> pulses = PulseIn(...)
+    >>> decoder = StreamingNECDecoder()
+    >>> while True:
+    ...     while pulses:
+    ...         code = decoder.feed(pulses.popleft())
+    ...         if code is not None:
+    ...             print(code)  # the four decoded bytes
+    """
+
+    _IDLE = 0  # waiting for a header mark
+    _HEADER = 1  # header mark seen, waiting for the header space
+    _DATA = 2  # consuming bit mark/space pairs
+
+    def __init__(self) -> None:
+        self._state = self._IDLE
+        self._expect_space = False
+        self._acc = 0
+        self._nbits = 0
+        self._code = bytearray(4)
+
+    def reset(self) -> None:
+        "Forget any partially received frame."
+        self._state = self._IDLE
+        self._expect_space = False
+        self._acc = 0
+        self._nbits = 0
+
+    def feed(self, pulse: int) -> Optional[bytes]:
+        """Consume one pulse length in microseconds.
+
+        Returns the four decoded bytes when ``pulse`` completes a frame,
+        otherwise None.
+        """
+        if self._state == self._DATA:
+            if not self._expect_space:
+                if _NEC_MARK_LO <= pulse <= _NEC_MARK_HI:
+                    self._expect_space = True
+                    return None
+            else:
+                self._expect_space = False
+                if _NEC_SPACE_LO <= pulse <= _NEC_SPACE_HI:
+                    self._acc = (self._acc << 1) | (pulse > _NEC_BIT_THRESHOLD)
+                    self._nbits += 1
+                    if self._nbits & 7 == 0:
+                        self._code[(self._nbits >> 3) - 1] = self._acc
+                        self._acc = 0
+                        if self._nbits == 32:
+                            self._state = self._IDLE
+                            return bytes(self._code)
+                    return None
+            # Pulse doesn't fit the frame; fall through and restart below.
+            self._state = self._IDLE
+        elif self._state == self._HEADER:
+            if _NEC_HEADER_SPACE_LO <= pulse <= _NEC_HEADER_SPACE_HI:
+                self._state = self._DATA
+                self._expect_space = False
+                self._acc = 0
+                self._nbits = 0
+                return None
+            # Not a header space; fall through so the pulse can still start a
+            # frame (a stray header mark may directly precede a real one).
+            self._state = self._IDLE
+        if _NEC_HEADER_MARK_LO <= pulse <= _NEC_HEADER_MARK_HI:
+            self._state = self._HEADER
+        return None
+
+
 class GenericDecode:
     """Generic decoding of infrared signals"""
 
@@ -278,8 +573,9 @@ class GenericDecode:
     def _read_pulses_non_blocking(  # pylint: disable=no-self-use
         self, input_pulses: List, max_pulse: int = 10000, pulse_window: float = 0.10
     ) -> Optional[List]:
-        """Read out a burst of pulses without blocking until pulses stop for a specified
-        period (pulse_window), pruning pulses after a pulse longer than ``max_pulse``.
+        """Read out a burst of pulses without blocking until a pulse longer
+        than ``max_pulse`` ends the burst or pulses stop for a specified
+        period (pulse_window).
 
         :param ~pulseio.PulseIn input_pulses: Object to read pulses from
         :param int max_pulse: Pulse duration to end a burst
@@ -290,7 +586,6 @@ class GenericDecode:
         # back-compat, hence we disable pylint.
         received = None
         recent_count = 0
-        pruning = False
         while True:
             while input_pulses:
                 pulse = input_pulses.popleft()
@@ -298,11 +593,13 @@ class GenericDecode:
                 if pulse > max_pulse:
                     if received is None:
                         continue
-                    pruning = True
-                if not pruning:
-                    if received is None:
-                        received = []
-                    received.append(pulse)
+                    # The inter-frame gap means the burst is complete; return
+                    # now instead of sleeping out another poll window. Any
+                    # following pulses stay queued for the next read.
+                    return received
+                if received is None:
+                    received = []
+                received.append(pulse)
 
             if recent_count == 0:
                 return received
@@ -363,6 +660,34 @@ class GenericTransmit:
         self.zero = zero
         self.trail = trail
         self.debug = debug
+        # Reusable pulse buffers keyed by buffer shape so repeated sends
+        # don't reallocate; see transmit().
+        self._template_cache = {}
+        # Lazily built byte-value -> pulse-pattern table; see _byte_pulses().
+        self._lut = None
+        self._lut_key = None
+
+    def _byte_pulses(self) -> List:
+        """Return a 256-entry table mapping a byte value to its 16 pulse
+        durations under the current one/zero timings.
+
+        Built lazily on first transmit (it costs ~8 KiB) and rebuilt only if
+        the timings change, so each payload byte can be written with a single
+        slice copy instead of eight bit tests.
+        """
+        key = (tuple(self.one), tuple(self.zero))
+        if self._lut is None or self._lut_key != key:
+            lut = []
+            for value in range(256):
+                pattern = array.array("H", [0] * 16)
+                for i in range(8):
+                    pair = self.one if value & (0x80 >> i) else self.zero
+                    pattern[2 * i] = pair[0]
+                    pattern[2 * i + 1] = pair[1]
+                lut.append(pattern)
+            self._lut = lut
+            self._lut_key = key
+        return self._lut
 
     def transmit(
         self,
@@ -382,35 +707,51 @@ class GenericTransmit:
         :param int nbits: Optional number of bits to send,
             useful to send fewer bits than in the data bytes
         """
+        # pylint: disable=too-many-locals
         bits_to_send = len(data) * 8
         if nbits is not None and nbits < bits_to_send:
             bits_to_send = nbits
 
-        durations = array.array(
-            "H",
-            [0]
-            * (len(self.header) + bits_to_send * 2 + (0 if self.trail is None else 1)),
-        )
+        # Reuse the buffer for this shape if we've sent one before; the key
+        # covers everything the buffer's size and layout depend on (header
+        # and trail are public attributes and may change between sends), and
+        # every slot is rewritten below, so no stale data survives.
+        key = (len(data), bits_to_send, len(self.header), self.trail is None)
+        durations = self._template_cache.get(key)
+        if durations is None:
+            durations = array.array(
+                "H",
+                [0]
+                * (
+                    len(self.header)
+                    + bits_to_send * 2
+                    + (0 if self.trail is None else 1)
+                ),
+            )
+            self._template_cache[key] = durations
 
-        for i, _ in enumerate(self.header):
-            durations[i] = self.header[i]
+        for i, duration in enumerate(self.header):
+            durations[i] = duration
 
         if self.trail is not None:
             durations[-1] = self.trail
         out = len(self.header)
-        bit_count = 0
-        for byte_index, _ in enumerate(data):
-            for i in range(7, -1, -1):
-                if (data[byte_index] & 1 << i) > 0:
-                    durations[out] = self.one[0]
-                    durations[out + 1] = self.one[1]
-                else:
-                    durations[out] = self.zero[0]
-                    durations[out + 1] = self.zero[1]
-                out += 2
-                bit_count += 1
-                if bit_count >= bits_to_send:
-                    break
+        full_bytes = bits_to_send // 8
+        tail_bits = bits_to_send & 7
+        if full_bytes:
+            lut = self._byte_pulses()
+            for byte_index in range(full_bytes):
+                # One C-level slice copy per byte instead of eight bit tests.
+                durations[out : out + 16] = lut[data[byte_index]]
+                out += 16
+        for i in range(7, 7 - tail_bits, -1):
+            if (data[full_bytes] & 1 << i) > 0:
+                durations[out] = self.one[0]
+                durations[out + 1] = self.one[1]
+            else:
+                durations[out] = self.zero[0]
+                durations[out + 1] = self.zero[1]
+            out += 2
 
         if self.debug:
             print(durations)